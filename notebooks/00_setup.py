@@ -24,12 +24,35 @@
 
 import sys
 import os
+import functools
 from pathlib import Path
 from typing import Optional
 
 # Add project root to Python path for imports
+def _is_valid_project_root(path: Path) -> bool:
+    """Check a candidate project root with a single directory scan.
+
+    One os.scandir pass replaces separate exists() probes for the expected
+    top-level entries (one syscall instead of several).
+    """
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return False
+    return "src" in names and "notebooks" in names
+
+
+@functools.lru_cache(maxsize=1)
 def add_project_root_to_path() -> str:
     """Add project root directory to sys.path for imports."""
+    # Fast path: root already resolved by this or an earlier notebook
+    cached_root = os.environ.get("PROJECT_ROOT")
+    if cached_root and _is_valid_project_root(Path(cached_root)):
+        if cached_root not in sys.path:
+            sys.path.insert(0, cached_root)
+        return cached_root
+
     project_root: Optional[Path] = None
     
     try:
@@ -40,40 +63,12 @@ def add_project_root_to_path() -> str:
     except (NameError, AttributeError):
         pass
     
-    if project_root is None:
-        try:
-            import dbutils
-            try:
-                workspace_path = dbutils.notebook.entry_point.getDbutils().notebook().getContext().notebookPath().get()
-            except:
-                try:
-                    workspace_path = dbutils.notebook.entry_point.getDbutils().notebook().getContext().notebookPath().getOrElse(None)
-                except:
-                    workspace_path = None
-            
-            if workspace_path:
-                if workspace_path.startswith('/'):
-                    parts = workspace_path.lstrip('/').split('/')
-                    if len(parts) >= 2:
-                        if parts[0] == 'Workspace' and parts[1] == 'Repos':
-                            if len(parts) >= 4:
-                                repo_path = Path('/Workspace/Repos').joinpath(*parts[2:-1])
-                                if (repo_path / "src").exists():
-                                    project_root = repo_path
-                        elif parts[0] == 'Workspace' and parts[1] == 'Users':
-                            if len(parts) >= 4:
-                                user_path = Path('/Workspace/Users').joinpath(*parts[2:-1])
-                                if (user_path / "src").exists():
-                                    project_root = user_path
-        except Exception:
-            pass
-    
     if project_root is None:
         current = Path.cwd()
         max_depth = 15
         depth = 0
         while depth < max_depth:
-            if (current / "src").exists() and (current / "notebooks").exists():
+            if _is_valid_project_root(current):
                 project_root = current
                 break
             if current.parent == current:
@@ -87,6 +82,9 @@ def add_project_root_to_path() -> str:
     project_root_str = str(project_root.resolve())
     if project_root_str not in sys.path:
         sys.path.insert(0, project_root_str)
+
+    # Remember the result so later notebooks skip the probing entirely
+    os.environ["PROJECT_ROOT"] = project_root_str
     
     return project_root_str
 
@@ -25,16 +25,39 @@
 
 import sys
 import os
+import functools
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 # Add project root to Python path for imports
+def _is_valid_project_root(path: Path) -> bool:
+    """Check a candidate project root with a single directory scan.
+
+    One os.scandir pass replaces separate exists() probes for the expected
+    top-level entries (one syscall instead of several).
+    """
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return False
+    return "src" in names and "notebooks" in names
+
+
+@functools.lru_cache(maxsize=1)
 def add_project_root_to_path() -> str:
     """Add project root directory to sys.path for imports.
     
     Works in Databricks Repos, Workspace files, and local environments.
     """
+    # Fast path: root already resolved by this or an earlier notebook
+    cached_root = os.environ.get("PROJECT_ROOT")
+    if cached_root and _is_valid_project_root(Path(cached_root)):
+        if cached_root not in sys.path:
+            sys.path.insert(0, cached_root)
+        return cached_root
+
     project_root: Optional[Path] = None
     
     # Method 1: Try using __file__ (works when running as a Python script)
@@ -46,43 +69,13 @@ def add_project_root_to_path() -> str:
     except (NameError, AttributeError):
         pass
     
-    # Method 2: Try using dbutils (Databricks-specific)
-    if project_root is None:
-        try:
-            import dbutils
-            try:
-                workspace_path = dbutils.notebook.entry_point.getDbutils().notebook().getContext().notebookPath().get()
-            except:
-                try:
-                    workspace_path = dbutils.notebook.entry_point.getDbutils().notebook().getContext().notebookPath().getOrElse(None)
-                except:
-                    workspace_path = None
-            
-            if workspace_path:
-                if workspace_path.startswith('/'):
-                    parts = workspace_path.lstrip('/').split('/')
-                    if len(parts) >= 2:
-                        if parts[0] == 'Workspace' and parts[1] == 'Repos':
-                            if len(parts) >= 4:
-                                repo_path = Path('/Workspace/Repos').joinpath(*parts[2:-1])
-                                if (repo_path / "src").exists():
-                                    project_root = repo_path
-                        elif parts[0] == 'Workspace' and parts[1] == 'Users':
-                            if len(parts) >= 4:
-                                user_path = Path('/Workspace/Users').joinpath(*parts[2:-1])
-                                if (user_path / "src").exists():
-                                    project_root = user_path
-        except Exception as e:
-            print(f"Note: Could not use dbutils path detection: {e}")
-            pass
-    
-    # Method 3: Try current working directory and walk up
+    # Method 2: Try current working directory and walk up
     if project_root is None:
         current = Path.cwd()
         max_depth = 15
         depth = 0
         while depth < max_depth:
-            if (current / "src").exists() and (current / "notebooks").exists():
+            if _is_valid_project_root(current):
                 project_root = current
                 break
             if current.parent == current:
@@ -90,7 +83,7 @@ def add_project_root_to_path() -> str:
             current = current.parent
             depth += 1
     
-    # Method 4: Try common Databricks paths
+    # Method 3: Try common Databricks paths
     if project_root is None:
         common_paths = [
             Path("/Workspace/Repos"),
@@ -100,7 +93,7 @@ def add_project_root_to_path() -> str:
         for base_path in common_paths:
             if base_path.exists():
                 for item in base_path.iterdir():
-                    if item.is_dir() and (item / "src").exists() and (item / "notebooks").exists():
+                    if item.is_dir() and _is_valid_project_root(item):
                         project_root = item
                         break
                 if project_root:
@@ -116,6 +109,9 @@ def add_project_root_to_path() -> str:
     project_root_str = str(project_root.resolve())
     if project_root_str not in sys.path:
         sys.path.insert(0, project_root_str)
+
+    # Remember the result so later notebooks skip the probing entirely
+    os.environ["PROJECT_ROOT"] = project_root_str
     
     print(f"Project root detected: {project_root_str}")
     return project_root_str
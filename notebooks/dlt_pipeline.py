@@ -28,17 +28,37 @@ from pyspark.sql import functions as F
 from pyspark.sql.window import Window
 from pyspark.sql.types import *
 import sys
+import os
+import functools
 from pathlib import Path
 
 # Add project root to path
+def _is_valid_project_root(path):
+    """Check a candidate project root with a single directory scan."""
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return False
+    return "src" in names and "notebooks" in names
+
+
+@functools.lru_cache(maxsize=1)
 def add_project_root_to_path():
     """Add project root to Python path for imports."""
+    # Fast path: root already resolved by this or an earlier notebook
+    cached_root = os.environ.get("PROJECT_ROOT")
+    if cached_root and _is_valid_project_root(Path(cached_root)):
+        if cached_root not in sys.path:
+            sys.path.insert(0, cached_root)
+        return cached_root
+
     project_root = None
     current = Path.cwd()
     max_depth = 15
     depth = 0
     while depth < max_depth:
-        if (current / "src").exists() and (current / "notebooks").exists():
+        if _is_valid_project_root(current):
             project_root = current
             break
         if current.parent == current:
@@ -50,6 +70,8 @@ def add_project_root_to_path():
         project_root_str = str(project_root.resolve())
         if project_root_str not in sys.path:
             sys.path.insert(0, project_root_str)
+        # Remember the result so later notebooks skip the probing entirely
+        os.environ["PROJECT_ROOT"] = project_root_str
         return project_root_str
     return None
 
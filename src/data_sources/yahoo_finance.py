@@ -8,6 +8,8 @@ No API keys required - uses public Yahoo Finance data.
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+import requests
+
 try:
     import yfinance as yf
     import pandas as pd
@@ -36,13 +38,17 @@ class YahooFinanceClient(BaseMarketDataClient):
     No API keys required.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
         """Initialize Yahoo Finance client.
 
+        Args:
+            session: Optional requests.Session to reuse pooled connections
+                across fetches. If None, yfinance manages its own session.
+
         Examples:
             >>> client = YahooFinanceClient()
         """
-        pass
+        self._session = session
 
     def _convert_interval(self, interval: str) -> str:
         """Convert standard interval to yfinance format.
@@ -127,7 +133,10 @@ class YahooFinanceClient(BaseMarketDataClient):
             # ONLY use yfinance - no REST API calls
             # yfinance.Ticker() creates a ticker object
             # ticker.history() downloads data using yfinance's internal HTTP handling
-            ticker = yf.Ticker(symbol)
+            if self._session is not None:
+                ticker = yf.Ticker(symbol, session=self._session)
+            else:
+                ticker = yf.Ticker(symbol)
 
             # Fetch historical data using yfinance
             # yfinance handles all HTTP requests, retries, and rate limiting internally
@@ -153,6 +162,133 @@ class YahooFinanceClient(BaseMarketDataClient):
                 f"Failed to fetch data for {symbol} from Yahoo Finance via yfinance: {error_msg}"
             ) from e
 
+    def fetch_bars_batch(
+        self,
+        symbols: List[str],
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = "1d",
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch bar data for many symbols with a single yfinance download.
+
+        yf.download accepts a list of tickers and retrieves them in one
+        batched request, so this replaces N per-symbol round-trips with one
+        call. Symbols the batch could not resolve fall back to individual
+        fetch_bars calls; symbols that still fail map to empty lists.
+
+        Args:
+            symbols: List of stock symbols (e.g., ["AAPL", "MSFT"])
+            start_time: Start datetime for data range
+            end_time: End datetime for data range
+            interval: Bar interval (default: "1d")
+
+        Returns:
+            Dictionary mapping each symbol to its list of bar dictionaries
+
+        Raises:
+            ValueError: If symbols list is empty or time range is invalid
+
+        Examples:
+            >>> client = YahooFinanceClient()
+            >>> start = datetime(2024, 1, 1)
+            >>> end = datetime(2024, 1, 31)
+            >>> bars = client.fetch_bars_batch(["AAPL", "MSFT"], start, end)
+            >>> set(bars.keys()) == {"AAPL", "MSFT"}
+            True
+        """
+        if not symbols:
+            raise ValueError("Symbols list cannot be empty")
+
+        if start_time >= end_time:
+            raise ValueError("start_time must be before end_time")
+
+        yfinance_interval = self._convert_interval(interval)
+
+        try:
+            # One batched yfinance download for all symbols - still no
+            # direct REST API calls
+            df = yf.download(
+                tickers=list(symbols),
+                start=start_time,
+                end=end_time,
+                interval=yfinance_interval,
+                group_by="ticker",
+                progress=False,
+            )
+        except Exception as e:
+            # Batch failed outright; fall back to per-symbol fetches
+            print(f"[WARN] Batch download failed ({e}); falling back to per-symbol fetches")
+            return self._fetch_bars_per_symbol(symbols, start_time, end_time, interval)
+
+        if df is None or df.empty:
+            return {symbol: [] for symbol in symbols}
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for symbol in symbols:
+            symbol_df = self._extract_symbol_frame(df, symbol)
+            if symbol_df is None:
+                # Symbol missing from the batch response; retry individually
+                try:
+                    results[symbol] = self.fetch_bars(
+                        symbol, start_time, end_time, interval
+                    )
+                except (ValueError, ConnectionError):
+                    results[symbol] = []
+            else:
+                results[symbol] = self._dataframe_to_bars(
+                    symbol, symbol_df.dropna(how="all")
+                )
+
+        return results
+
+    def _fetch_bars_per_symbol(
+        self,
+        symbols: List[str],
+        start_time: datetime,
+        end_time: datetime,
+        interval: str,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch each symbol individually, mapping failures to empty lists.
+
+        Args:
+            symbols: List of stock symbols
+            start_time: Start datetime for data range
+            end_time: End datetime for data range
+            interval: Bar interval
+
+        Returns:
+            Dictionary mapping each symbol to its list of bar dictionaries
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for symbol in symbols:
+            try:
+                results[symbol] = self.fetch_bars(symbol, start_time, end_time, interval)
+            except (ValueError, ConnectionError):
+                results[symbol] = []
+        return results
+
+    @staticmethod
+    def _extract_symbol_frame(
+        df: pd.DataFrame, symbol: str
+    ) -> Optional[pd.DataFrame]:
+        """Pull one symbol's OHLCV frame out of a batched download result.
+
+        yf.download returns ticker-keyed MultiIndex columns for multi-symbol
+        requests and plain columns for single-symbol requests.
+
+        Args:
+            df: DataFrame returned by yf.download
+            symbol: Symbol to extract
+
+        Returns:
+            The symbol's OHLCV DataFrame, or None if it is absent
+        """
+        if isinstance(df.columns, pd.MultiIndex):
+            if symbol in df.columns.get_level_values(0):
+                return df[symbol]
+            return None
+        return df
+
     def _dataframe_to_bars(self, symbol: str, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Convert pandas DataFrame from yfinance to standardized bar format.
 
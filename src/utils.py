@@ -5,26 +5,115 @@ Includes symbol scraping utilities, logging helpers, date/time utilities,
 error handling decorators, retry logic, and data validation helpers.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, timedelta, time, date
+import asyncio
+import functools
+import json
+import logging
+import os
+import re
 import time as time_module
+import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.etree
 
 try:
     from .data_sources import YahooFinanceClient
+    from .config import DATA_SOURCES, PIPELINE_CONFIG, SYMBOL_CONFIG
 except ImportError:
     # Handle case where running as standalone script
     from src.data_sources import YahooFinanceClient
+    from src.config import DATA_SOURCES, PIPELINE_CONFIG, SYMBOL_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session with connection pooling and retries. Reusing pooled
+# connections avoids a fresh TCP+TLS handshake per request, which dominates
+# latency for repeated same-host calls (scrape + Yahoo Finance). The Retry
+# policy backs off exponentially on transient server errors and honors any
+# Retry-After header the server sends on a 429.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+
+# Yahoo Finance rate-limit/retry tuning (see src/config.py)
+_YAHOO_CONFIG = DATA_SOURCES["yahoo_finance"]
+
+
+def _read_symbol_cache(cache_path: str, ttl_seconds: float) -> Optional[List[str]]:
+    """Read the cached S&P 500 symbol list if it exists and is fresh.
 
+    Args:
+        cache_path: Path to the JSON cache file
+        ttl_seconds: Maximum cache age in seconds
+
+    Returns:
+        The cached symbol list, or None if the cache is missing, stale,
+        or unreadable
+    """
+    try:
+        if time_module.time() - os.path.getmtime(cache_path) >= ttl_seconds:
+            return None
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if isinstance(cached, list) and cached:
+        return cached
+    return None
+
+
+def _write_symbol_cache(cache_path: str, symbols: List[str]) -> None:
+    """Atomically write the S&P 500 symbol list to the cache file.
+
+    Writes to a temp file and renames it into place so concurrent readers
+    never see a partially written cache. Failures are swallowed because
+    the cache is purely an optimization.
+
+    Args:
+        cache_path: Path to the JSON cache file
+        symbols: Symbol list to cache
+    """
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(symbols, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
-def get_sp500_symbols() -> List[str]:
+
+def get_sp500_symbols(force_refresh: bool = False) -> List[str]:
     """Fetch all S&P 500 stock symbols from stockanalysis.com.
 
     Scrapes the S&P 500 stocks list page and extracts all stock symbols
     from the table. Handles symbols with dots (e.g., BRK.B) and returns
     a deduplicated, sorted list.
 
+    Results are cached on disk (path from the SP500_CACHE_PATH environment
+    variable, default /tmp/sp500_cache.json) for the TTL configured in
+    SYMBOL_CONFIG, so repeated runs within the TTL skip the scrape. The
+    constituent list only changes occasionally, so a stale-by-hours list
+    is acceptable.
+
+    Args:
+        force_refresh: If True, bypass the cache and re-scrape
+
     Returns:
         List of S&P 500 stock symbols (e.g., ['AAPL', 'MSFT', 'BRK.B'])
 
@@ -41,69 +130,99 @@ def get_sp500_symbols() -> List[str]:
         >>> 'BRK.B' in symbols
         True
     """
+    cache_path = os.environ.get("SP500_CACHE_PATH", "/tmp/sp500_cache.json")
+    ttl_seconds = float(SYMBOL_CONFIG["symbol_cache_ttl_hours"]) * 3600
+    use_cache = bool(SYMBOL_CONFIG["cache_symbols"])
+
+    if use_cache and not force_refresh:
+        cached = _read_symbol_cache(cache_path, ttl_seconds)
+        if cached is not None:
+            return cached
+
     url = "https://stockanalysis.com/list/sp-500-stocks/"
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        # Ask for compressed HTML explicitly; urllib3 decompresses
+        # transparently, so the page crosses the wire at a fraction of its
+        # uncompressed size
+        "Accept-Encoding": "gzip, deflate",
     }
 
+    # Stream the response and parse incrementally: the symbols table sits
+    # near the top of the page, so we can stop downloading and parsing as
+    # soon as its closing tag arrives, and we never hold the raw bytes and
+    # a fully decoded copy of the page in memory at the same time.
+    table = None
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        with _SESSION.get(url, headers=headers, timeout=10, stream=True) as response:
+            response.raise_for_status()
+
+            parser = lxml.etree.HTMLPullParser(
+                events=("end",), tag="table", huge_tree=False
+            )
+            for chunk in response.iter_content(8192):
+                parser.feed(chunk)
+                for _event, element in parser.read_events():
+                    table = element
+                    break
+                if table is not None:
+                    break
+            else:
+                # End of input without a complete table: flush the parser in
+                # case the final chunk closed it
+                try:
+                    parser.close()
+                except lxml.etree.XMLSyntaxError:
+                    pass
+                for _event, element in parser.read_events():
+                    table = element
+                    break
     except requests.RequestException as e:
         raise requests.RequestException(
             f"Failed to fetch S&P 500 list from {url}: {e}"
         ) from e
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    symbols: List[str] = []
-
-    # Find the table containing stock symbols
     # The table has columns: No., Symbol, Company Name, Market Cap, Stock Price, % Change, Revenue
-    tables = soup.find_all("table")
-
-    if not tables:
+    if table is None:
         raise ValueError("No table found on the S&P 500 stocks page")
 
-    # Process the first table (should be the main stocks table)
-    table = tables[0]
-    rows = table.find_all("tr")
-
-    for row in rows:
-        cells = row.find_all(["td", "th"])
-        if len(cells) < 2:
-            continue
-
-        # The symbol is typically in the second column (index 1)
-        # It's usually in a link with href like /stocks/AAPL/
-        symbol_cell = cells[1]
-
-        # Try to extract from link first
-        link = symbol_cell.find("a")
-        if link:
-            href = link.get("href", "")
-            # Extract symbol from href like /stocks/AAPL/ or /stocks/BRK.B/
-            if "/stocks/" in href:
-                symbol = href.split("/stocks/")[1].rstrip("/").upper()
-                if symbol and _is_valid_symbol(symbol):
-                    symbols.append(symbol)
-                    continue
-
-        # Fallback: extract from cell text
-        symbol_text = symbol_cell.get_text().strip().upper()
-        if _is_valid_symbol(symbol_text):
-            symbols.append(symbol_text)
+    # The symbol lives in the second column of the table, usually inside a
+    # link with href like /stocks/AAPL/ or /stocks/BRK.B/. Two flat XPaths
+    # return every candidate at once, and set comprehensions normalize and
+    # validate them without any per-row traversal code.
+    hrefs = table.xpath(".//tr/td[2]//a/@href")
+    texts = table.xpath(".//tr/td[2]//text()")
+
+    symbols: Set[str] = {
+        href.split("/stocks/")[1].rstrip("/").upper()
+        for href in hrefs
+        if "/stocks/" in href
+    }
+    # Cells without a link carry the symbol as plain text
+    symbols |= {text.strip().upper() for text in texts}
+    symbols = {symbol for symbol in symbols if _is_valid_symbol(symbol)}
 
     if not symbols:
         raise ValueError(
             "No symbols found in the table. Page structure may have changed."
         )
 
-    # Deduplicate and sort
-    unique_symbols = sorted(list(set(symbols)))
+    # Already deduplicated by the set; just sort
+    unique_symbols = sorted(symbols)
+
+    if use_cache:
+        _write_symbol_cache(cache_path, unique_symbols)
 
     return unique_symbols
 
 
+# Precompiled symbol validation pattern: 1-5 uppercase letters, digits, and
+# dots, with at least one letter and no leading/trailing dot. A single C-level
+# regex match is far cheaper than per-character Python checks in the scrape loop.
+_SYMBOL_RE = re.compile(r"(?!\.)(?!.*\.$)(?=.{1,5}$)(?=.*[A-Z])[A-Z0-9.]+")
+
+
+@functools.lru_cache(maxsize=2048)
 def _is_valid_symbol(symbol: str) -> bool:
     """Check if a string is a valid stock symbol.
 
@@ -135,31 +254,7 @@ def _is_valid_symbol(symbol: str) -> bool:
         >>> _is_valid_symbol('.A')
         False
     """
-    if not symbol:
-        return False
-
-    if len(symbol) > 5:
-        return False
-
-    # Cannot start or end with a dot
-    if symbol.startswith(".") or symbol.endswith("."):
-        return False
-
-    # Must contain at least one letter
-    if not any(c.isalpha() for c in symbol):
-        return False
-
-    # Only uppercase letters, numbers, and dots allowed
-    # Check that all characters are uppercase letters, digits, or dots
-    for c in symbol:
-        if c == ".":
-            continue
-        if not c.isalnum():
-            return False
-        if c.isalpha() and not c.isupper():
-            return False
-
-    return True
+    return _SYMBOL_RE.fullmatch(symbol) is not None
 
 
 def get_last_trading_day(reference_date: Optional[date] = None) -> date:
@@ -344,6 +439,148 @@ def calculate_good_friday(year: int) -> date:
     return good_friday
 
 
+def _is_rate_limit_error(error_msg: str) -> bool:
+    """Check whether an error message indicates Yahoo Finance rate limiting.
+
+    Args:
+        error_msg: The stringified exception
+
+    Returns:
+        True if the error looks like a 429/rate-limit response
+    """
+    lowered = error_msg.lower()
+    return "429" in error_msg or "rate limit" in lowered or "too many" in lowered
+
+
+def _fetch_bars_with_retry(
+    client: YahooFinanceClient,
+    symbol: str,
+    market_open: datetime,
+    market_close: datetime,
+) -> List[Dict[str, Any]]:
+    """Fetch one symbol's 5-minute bars, retrying rate limits with backoff.
+
+    Rate-limit errors are retried up to the configured number of attempts,
+    doubling the wait each time (exponential backoff). Other errors propagate
+    immediately so the caller can decide how to handle them.
+
+    Args:
+        client: YahooFinanceClient to fetch with
+        symbol: Stock symbol to fetch
+        market_open: Start of the market-hours window
+        market_close: End of the market-hours window
+
+    Returns:
+        List of bar dictionaries
+
+    Raises:
+        ValueError: If the fetch fails with a non-retryable client error
+        ConnectionError: If the fetch keeps failing after all retries
+    """
+    retry_attempts = int(_YAHOO_CONFIG["retry_attempts"])
+    base_delay = float(_YAHOO_CONFIG["retry_delay_seconds"])
+
+    for attempt in range(retry_attempts + 1):
+        try:
+            return client.fetch_bars(
+                symbol=symbol,
+                start_time=market_open,
+                end_time=market_close,
+                interval="5m",
+            )
+        except (ValueError, ConnectionError) as e:
+            if not _is_rate_limit_error(str(e)) or attempt >= retry_attempts:
+                raise
+            wait_time = base_delay * (2**attempt)
+            print(
+                f"[WARN] Rate limited fetching {symbol}; "
+                f"waiting {wait_time:.0f}s before retry "
+                f"{attempt + 1}/{retry_attempts}..."
+            )
+            time_module.sleep(wait_time)
+
+    # Unreachable: the loop either returns or raises
+    raise ConnectionError(f"Failed to fetch bars for {symbol}")
+
+
+def _fetch_batch_with_retry(
+    client: YahooFinanceClient,
+    symbols: List[str],
+    market_open: datetime,
+    market_close: datetime,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch a batch of symbols' 5-minute bars, retrying rate limits.
+
+    Batch counterpart of _fetch_bars_with_retry: rate-limit errors are
+    retried with exponential backoff, other errors propagate immediately.
+
+    Args:
+        client: YahooFinanceClient to fetch with
+        symbols: Batch of stock symbols to fetch
+        market_open: Start of the market-hours window
+        market_close: End of the market-hours window
+
+    Returns:
+        Dictionary mapping each symbol in the batch to its bars
+
+    Raises:
+        ValueError: If the fetch fails with a non-retryable client error
+        ConnectionError: If the fetch keeps failing after all retries
+    """
+    retry_attempts = int(_YAHOO_CONFIG["retry_attempts"])
+    base_delay = float(_YAHOO_CONFIG["retry_delay_seconds"])
+
+    for attempt in range(retry_attempts + 1):
+        try:
+            return client.fetch_bars_batch(
+                symbols,
+                start_time=market_open,
+                end_time=market_close,
+                interval="5m",
+            )
+        except (ValueError, ConnectionError) as e:
+            if not _is_rate_limit_error(str(e)) or attempt >= retry_attempts:
+                raise
+            wait_time = base_delay * (2**attempt)
+            print(
+                f"[WARN] Rate limited fetching batch of {len(symbols)} symbols; "
+                f"waiting {wait_time:.0f}s before retry "
+                f"{attempt + 1}/{retry_attempts}..."
+            )
+            time_module.sleep(wait_time)
+
+    # Unreachable: the loop either returns or raises
+    raise ConnectionError(f"Failed to fetch bars for batch of {len(symbols)} symbols")
+
+
+def _resolve_target_date(date: Optional[datetime] = None) -> date:
+    """Resolve the trading day to fetch bars for.
+
+    If no date is given, finds the last trading day (skipping weekends and
+    NYSE holidays). Very recent trading days are pushed back a few more
+    trading days because Yahoo Finance may have delays and rate limiting
+    issues with very recent dates.
+
+    Args:
+        date: Optional specific date to fetch. If None, finds the last trading day.
+
+    Returns:
+        The date to fetch bars for
+    """
+    if date is None:
+        last_trading_day = get_last_trading_day()
+        today = datetime.now().date()
+
+        # If the last trading day is very recent (within 2 days), go back further
+        # This helps avoid rate limiting and ensures data availability
+        if last_trading_day >= today - timedelta(days=2):
+            # Go back 3 more trading days to ensure data is available
+            return get_last_trading_day(last_trading_day - timedelta(days=3))
+        return last_trading_day
+
+    return date.date() if isinstance(date, datetime) else date
+
+
 def fetch_previous_day_5min_bars(
     symbols: List[str],
     client: Optional[YahooFinanceClient] = None,
@@ -356,6 +593,11 @@ def fetch_previous_day_5min_bars(
     recent trading day, skipping weekends and NYSE holidays. Market hours are
     assumed to be 9:30 AM to 4:00 PM ET.
 
+    Symbols are validated up front (invalid ones are skipped with a warning
+    and map to empty lists) and the rest are fetched in batches of
+    PIPELINE_CONFIG["batch_size"] via the client's batch endpoint, so one
+    request covers many symbols and a failure costs at most one batch.
+
     Args:
         symbols: List of stock symbols to fetch data for
         client: Optional YahooFinanceClient instance. If None, creates a new one.
@@ -389,96 +631,236 @@ def fetch_previous_day_5min_bars(
         raise ValueError("Symbols list cannot be empty")
 
     if client is None:
-        client = YahooFinanceClient()
+        # Share the pooled session so Yahoo Finance requests reuse sockets
+        client = YahooFinanceClient(session=_SESSION)
 
-    # Determine the date to fetch
-    if date is None:
-        # Find the last trading day (skips weekends and NYSE holidays)
-        # Go back at least 2-3 trading days to ensure data is available
-        # (Yahoo Finance may have delays and rate limiting issues with very recent dates)
-        last_trading_day = get_last_trading_day()
-        today = datetime.now().date()
-
-        # If the last trading day is very recent (within 2 days), go back further
-        # This helps avoid rate limiting and ensures data availability
-        if last_trading_day >= today - timedelta(days=2):
-            # Go back 3 more trading days to ensure data is available
-            target_date = get_last_trading_day(last_trading_day - timedelta(days=3))
-        else:
-            target_date = last_trading_day
-    else:
-        target_date = date.date() if isinstance(date, datetime) else date
+    target_date = _resolve_target_date(date)
 
     # Market hours: 9:30 AM to 4:00 PM ET (simplified to local time)
     # In production, you'd want to handle timezone conversion properly
     market_open = datetime.combine(target_date, time(9, 30))
     market_close = datetime.combine(target_date, time(16, 0))
 
-    results: Dict[str, List[Dict[str, Any]]] = {}
+    # Every requested symbol gets an entry; invalid and failed symbols
+    # keep their empty lists
+    results: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in symbols}
+
+    # Pre-validate once up front so obviously bad symbols (typos, delisted
+    # junk) never reach the network or trigger per-symbol exceptions
+    valid_symbols = [s for s in symbols if _is_valid_symbol(s)]
+    skipped = [s for s in symbols if not _is_valid_symbol(s)]
+    if skipped:
+        logger.warning(
+            "Skipping %d invalid symbols: %s", len(skipped), ", ".join(skipped)
+        )
+
+    batch_size = int(PIPELINE_CONFIG["batch_size"])
+    batches = [
+        valid_symbols[i : i + batch_size]
+        for i in range(0, len(valid_symbols), batch_size)
+    ]
 
     print(
-        f"Fetching full trading day data (9:30 AM - 4:00 PM) for {len(symbols)} symbols..."
+        f"Fetching full trading day data (9:30 AM - 4:00 PM) for "
+        f"{len(valid_symbols)} symbols in {len(batches)} batches..."
     )
     print(f"Target date: {target_date}")
-    print(f"Each symbol requires 1 API request for the full day's 5-minute bars\n")
 
-    for i, symbol in enumerate(symbols):
+    rate_limit_delay = float(_YAHOO_CONFIG["rate_limit_delay_seconds"])
+
+    for i, batch in enumerate(batches):
         try:
-            # Single request per symbol to get the full day's 5-minute bars
-            # This is more efficient than multiple requests per symbol
-            print(f"[{i+1}/{len(symbols)}] Fetching {symbol}...", end=" ", flush=True)
-            bars = client.fetch_bars(
-                symbol=symbol,
-                start_time=market_open,
-                end_time=market_close,
-                interval="5m",
+            # One batched request per chunk of symbols; rate-limit errors
+            # are retried with exponential backoff
+            print(
+                f"[{i+1}/{len(batches)}] Fetching batch of {len(batch)} symbols...",
+                end=" ",
+                flush=True,
             )
-            results[symbol] = bars
-            print(f"[OK] Got {len(bars)} bars")
+            batch_results = _fetch_batch_with_retry(
+                client, batch, market_open, market_close
+            )
+            results.update(batch_results)
+            total_bars = sum(len(bars) for bars in batch_results.values())
+            print(f"[OK] Got {total_bars} bars")
+        except (ValueError, ConnectionError) as e:
+            # Log error but continue with other batches; the batch's symbols
+            # keep their empty lists
+            print(f"[FAIL] Error: {str(e)[:100]}")
 
-            # Add delay between symbols to avoid rate limiting
-            # Only delay if not the last symbol
-            if i < len(symbols) - 1:
-                delay = 3.0  # 3 second delay between symbols
-                time_module.sleep(delay)
+        # Add delay between batches to avoid rate limiting
+        # Only delay if not the last batch
+        if i < len(batches) - 1:
+            time_module.sleep(rate_limit_delay)
 
-        except (ValueError, ConnectionError) as e:
-            # Log error but continue with other symbols
-            error_msg = str(e)
-            if (
-                "429" in error_msg
-                or "rate limit" in error_msg.lower()
-                or "too many" in error_msg.lower()
-            ):
-                # If rate limited, wait longer before continuing
-                wait_time = 15.0  # Wait 15 seconds on rate limit
-                print(f"[WARN] Rate limited")
-                print(f"       Waiting {wait_time} seconds before retrying {symbol}...")
-                time_module.sleep(wait_time)
-                # Try once more after waiting
+    print(f"\nCompleted fetching data for {len(symbols)} symbols")
+    return results
+
+
+def bars_to_dataframe(bars: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Convert a list of bar dictionaries to a typed pandas DataFrame.
+
+    The columnar, NumPy-backed frame (float64 OHLC, int64 volume, UTC
+    datetime64 timestamps) is far more compact in memory than a list of
+    per-row dicts, and Spark's createDataFrame ingests it without
+    Python-level row iteration.
+
+    Args:
+        bars: List of bar dictionaries as returned by fetch_bars
+
+    Returns:
+        DataFrame with symbol, timestamp, open, high, low, close, and
+        volume columns; empty input yields an empty frame with the same
+        typed columns
+    """
+    dtypes = {
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "volume": "int64",
+    }
+
+    if not bars:
+        empty = {"symbol": pd.Series(dtype="object")}
+        empty["timestamp"] = pd.Series(dtype="datetime64[ns, UTC]")
+        empty.update({col: pd.Series(dtype=dtype) for col, dtype in dtypes.items()})
+        return pd.DataFrame(empty)
+
+    df = pd.DataFrame(bars)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True).astype(
+        "datetime64[ns, UTC]"
+    )
+    return df.astype(dtypes)
+
+
+def fetch_previous_day_5min_bars_df(
+    symbols: List[str],
+    client: Optional[YahooFinanceClient] = None,
+    date: Optional[datetime] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Fetch last trading day's 5-minute bars as typed pandas DataFrames.
+
+    DataFrame variant of fetch_previous_day_5min_bars for callers that
+    hand the data to Spark: per-symbol frames can be pandas.concat'ed and
+    passed to spark.createDataFrame in one shot instead of iterating bar
+    dicts row by row.
+
+    Args:
+        symbols: List of stock symbols to fetch data for
+        client: Optional YahooFinanceClient instance. If None, creates a new one.
+        date: Optional specific date to fetch. If None, finds the last trading day.
+
+    Returns:
+        Dictionary mapping symbol to a typed OHLCV DataFrame. Symbols that
+        fail to fetch map to empty frames.
+
+    Raises:
+        ValueError: If symbols list is empty
+    """
+    bars_data = fetch_previous_day_5min_bars(symbols, client=client, date=date)
+    return {symbol: bars_to_dataframe(bars) for symbol, bars in bars_data.items()}
+
+
+async def fetch_previous_day_5min_bars_async(
+    symbols: List[str],
+    client: Optional[YahooFinanceClient] = None,
+    date: Optional[datetime] = None,
+    max_concurrency: int = 8,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch last trading day's 5-minute bars for many symbols concurrently.
+
+    Asyncio variant of fetch_previous_day_5min_bars. The per-symbol fetches
+    are I/O-bound, so running them concurrently (bounded by a semaphore to
+    stay under Yahoo's rate limits) cuts wall-clock time roughly by the
+    concurrency factor compared to the serial loop. yfinance is a blocking
+    library, so each fetch runs in a worker thread via asyncio.to_thread.
+
+    Args:
+        symbols: List of stock symbols to fetch data for
+        client: Optional YahooFinanceClient instance. If None, creates a new one.
+        date: Optional specific date to fetch. If None, finds the last trading day.
+        max_concurrency: Maximum number of in-flight fetches
+
+    Returns:
+        Dictionary mapping symbol to list of bar dictionaries, same shape as
+        fetch_previous_day_5min_bars. Symbols that fail to fetch map to
+        empty lists.
+
+    Raises:
+        ValueError: If symbols list is empty
+    """
+    if not symbols:
+        raise ValueError("Symbols list cannot be empty")
+
+    if client is None:
+        client = YahooFinanceClient(session=_SESSION)
+
+    target_date = _resolve_target_date(date)
+    market_open = datetime.combine(target_date, time(9, 30))
+    market_close = datetime.combine(target_date, time(16, 0))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    retry_attempts = int(_YAHOO_CONFIG["retry_attempts"])
+    base_delay = float(_YAHOO_CONFIG["retry_delay_seconds"])
+
+    async def fetch_one(symbol: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            for attempt in range(retry_attempts + 1):
                 try:
-                    bars = client.fetch_bars(
+                    return await asyncio.to_thread(
+                        client.fetch_bars,
                         symbol=symbol,
                         start_time=market_open,
                         end_time=market_close,
                         interval="5m",
                     )
-                    results[symbol] = bars
-                    print(f"[OK] Retry successful - Got {len(bars)} bars")
-                    # Still add delay before next symbol
-                    if i < len(symbols) - 1:
-                        time_module.sleep(3.0)
-                    continue
-                except Exception as retry_error:
-                    print(f"[FAIL] Retry failed: {retry_error}")
-                    pass  # If it still fails, continue with empty list
-            else:
-                print(f"[FAIL] Error: {error_msg[:100]}")
+                except (ValueError, ConnectionError) as e:
+                    if not _is_rate_limit_error(str(e)) or attempt >= retry_attempts:
+                        raise
+                    # Exponential backoff without blocking the event loop
+                    await asyncio.sleep(base_delay * (2**attempt))
+            raise ConnectionError(f"Failed to fetch bars for {symbol}")
+
+    print(
+        f"Fetching full trading day data (9:30 AM - 4:00 PM) for {len(symbols)} symbols "
+        f"({max_concurrency} concurrent)..."
+    )
+    print(f"Target date: {target_date}")
+
+    outcomes = await asyncio.gather(
+        *(fetch_one(symbol) for symbol in symbols), return_exceptions=True
+    )
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for symbol, outcome in zip(symbols, outcomes):
+        if isinstance(outcome, (ValueError, ConnectionError)):
+            # Same policy as the serial loop: log and continue with an empty list
+            print(f"[FAIL] {symbol}: {str(outcome)[:100]}")
             results[symbol] = []
-            # Still add delay even on error to avoid compounding rate limits
-            if i < len(symbols) - 1:
-                time_module.sleep(3.0)
-            continue
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[symbol] = outcome
 
     print(f"\nCompleted fetching data for {len(symbols)} symbols")
     return results
+
+
+def fetch_previous_day_5min_bars_parallel(
+    symbols: List[str],
+    client: Optional[YahooFinanceClient] = None,
+    date: Optional[datetime] = None,
+    max_concurrency: int = 8,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Synchronous wrapper around fetch_previous_day_5min_bars_async.
+
+    Convenience entry point for notebooks and scripts that are not running
+    an event loop. See fetch_previous_day_5min_bars_async for details.
+    """
+    return asyncio.run(
+        fetch_previous_day_5min_bars_async(
+            symbols, client=client, date=date, max_concurrency=max_concurrency
+        )
+    )
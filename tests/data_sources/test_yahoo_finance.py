@@ -155,6 +155,88 @@ class TestYahooFinanceClient:
         assert bars[0]["close"] == 150.5
         assert mock_ticker.history.call_args[1]["interval"] == "5m"
 
+    def test_fetch_bars_batch_empty_symbols(self) -> None:
+        """Test fetch_bars_batch raises ValueError for empty symbols list."""
+        client = YahooFinanceClient()
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 1, 31)
+
+        with pytest.raises(ValueError, match="Symbols list cannot be empty"):
+            client.fetch_bars_batch([], start, end)
+
+    def test_fetch_bars_batch_invalid_time_range(self) -> None:
+        """Test fetch_bars_batch raises ValueError for invalid time range."""
+        client = YahooFinanceClient()
+        start = datetime(2024, 1, 31)
+        end = datetime(2024, 1, 1)
+
+        with pytest.raises(ValueError, match="start_time must be before end_time"):
+            client.fetch_bars_batch(["AAPL"], start, end)
+
+    @patch("src.data_sources.yahoo_finance.yf.download")
+    def test_fetch_bars_batch_success(self, mock_download: Mock) -> None:
+        """Test one batched download returning data for multiple symbols."""
+        dates = pd.date_range("2024-01-01", periods=2, freq="D")
+        columns = pd.MultiIndex.from_product(
+            [["AAPL", "MSFT"], ["Open", "High", "Low", "Close", "Volume"]]
+        )
+        data = [
+            [150.0, 152.0, 149.0, 151.0, 1000000, 300.0, 302.0, 299.0, 301.0, 500000],
+            [151.0, 153.0, 150.0, 152.0, 1100000, 301.0, 303.0, 300.0, 302.0, 600000],
+        ]
+        mock_download.return_value = pd.DataFrame(data, index=dates, columns=columns)
+
+        client = YahooFinanceClient()
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 1, 31)
+
+        results = client.fetch_bars_batch(["AAPL", "MSFT"], start, end, "1d")
+
+        assert set(results.keys()) == {"AAPL", "MSFT"}
+        assert len(results["AAPL"]) == 2
+        assert results["AAPL"][0]["open"] == 150.0
+        assert results["MSFT"][0]["close"] == 301.0
+        # One download call for both symbols
+        mock_download.assert_called_once()
+        assert mock_download.call_args[1]["tickers"] == ["AAPL", "MSFT"]
+
+    @patch("src.data_sources.yahoo_finance.yf.download")
+    def test_fetch_bars_batch_empty_result(self, mock_download: Mock) -> None:
+        """Test fetch_bars_batch maps an empty download to empty lists."""
+        mock_download.return_value = pd.DataFrame()
+
+        client = YahooFinanceClient()
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 1, 31)
+
+        results = client.fetch_bars_batch(["AAPL", "MSFT"], start, end)
+
+        assert results == {"AAPL": [], "MSFT": []}
+
+    @patch("src.data_sources.yahoo_finance.yf.download")
+    def test_fetch_bars_batch_missing_symbol_falls_back(
+        self, mock_download: Mock
+    ) -> None:
+        """Test that symbols absent from the batch retry individually."""
+        dates = pd.date_range("2024-01-01", periods=1, freq="D")
+        columns = pd.MultiIndex.from_product(
+            [["AAPL"], ["Open", "High", "Low", "Close", "Volume"]]
+        )
+        mock_download.return_value = pd.DataFrame(
+            [[150.0, 152.0, 149.0, 151.0, 1000000]], index=dates, columns=columns
+        )
+
+        client = YahooFinanceClient()
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 1, 31)
+
+        with patch.object(client, "fetch_bars", return_value=[]) as mock_fetch:
+            results = client.fetch_bars_batch(["AAPL", "MISSING"], start, end)
+
+        assert len(results["AAPL"]) == 1
+        assert results["MISSING"] == []
+        mock_fetch.assert_called_once_with("MISSING", start, end, "1d")
+
     def test_dataframe_to_bars(self) -> None:
         """Test _dataframe_to_bars conversion."""
         client = YahooFinanceClient()
@@ -7,18 +7,37 @@ from unittest.mock import Mock, patch, MagicMock
 from typing import List, Dict, Any
 from datetime import datetime, timedelta, time, date
 
+import pandas as pd
+
 from src.utils import (
     get_sp500_symbols,
     _is_valid_symbol,
+    bars_to_dataframe,
     fetch_previous_day_5min_bars,
+    fetch_previous_day_5min_bars_df,
+    fetch_previous_day_5min_bars_parallel,
     get_last_trading_day,
 )
 
 
+def _mock_stream_response(html: str) -> MagicMock:
+    """Build a mock streaming response for get_sp500_symbols tests."""
+    response = MagicMock()
+    response.raise_for_status = Mock()
+    response.iter_content.return_value = [html.encode("utf-8")]
+    response.__enter__.return_value = response
+    return response
+
+
 class TestGetSp500Symbols:
     """Test suite for get_sp500_symbols function."""
 
-    @patch("src.utils.requests.get")
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch) -> None:
+        """Point the symbol cache at a per-test temp file."""
+        monkeypatch.setenv("SP500_CACHE_PATH", str(tmp_path / "sp500_cache.json"))
+
+    @patch("src.utils._SESSION.get")
     def test_get_sp500_symbols_success(self, mock_get: Mock) -> None:
         """Test successful extraction of S&P 500 symbols."""
         # Mock HTML response with sample S&P 500 table
@@ -56,10 +75,7 @@ class TestGetSp500Symbols:
         </html>
         """
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_stream_response(mock_html)
 
         symbols = get_sp500_symbols()
 
@@ -71,7 +87,7 @@ class TestGetSp500Symbols:
         assert "GOOG" in symbols
         assert symbols == sorted(symbols)  # Should be sorted
 
-    @patch("src.utils.requests.get")
+    @patch("src.utils._SESSION.get")
     def test_get_sp500_symbols_deduplication(self, mock_get: Mock) -> None:
         """Test that duplicate symbols are removed."""
         mock_html = """
@@ -95,30 +111,24 @@ class TestGetSp500Symbols:
         </html>
         """
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_stream_response(mock_html)
 
         symbols = get_sp500_symbols()
 
         assert len(symbols) == 1
         assert symbols == ["AAPL"]
 
-    @patch("src.utils.requests.get")
+    @patch("src.utils._SESSION.get")
     def test_get_sp500_symbols_no_table(self, mock_get: Mock) -> None:
         """Test that ValueError is raised when no table is found."""
         mock_html = "<html><body><p>No table here</p></body></html>"
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_stream_response(mock_html)
 
         with pytest.raises(ValueError, match="No table found"):
             get_sp500_symbols()
 
-    @patch("src.utils.requests.get")
+    @patch("src.utils._SESSION.get")
     def test_get_sp500_symbols_no_symbols(self, mock_get: Mock) -> None:
         """Test that ValueError is raised when no symbols are found."""
         mock_html = """
@@ -138,15 +148,12 @@ class TestGetSp500Symbols:
         </html>
         """
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _mock_stream_response(mock_html)
 
         with pytest.raises(ValueError, match="No symbols found"):
             get_sp500_symbols()
 
-    @patch("src.utils.requests.get")
+    @patch("src.utils._SESSION.get")
     def test_get_sp500_symbols_request_exception(self, mock_get: Mock) -> None:
         """Test that RequestException is raised when HTTP request fails."""
         mock_get.side_effect = Exception("Connection error")
@@ -154,6 +161,39 @@ class TestGetSp500Symbols:
         with pytest.raises(Exception, match="Connection error"):
             get_sp500_symbols()
 
+    @patch("src.utils._SESSION.get")
+    def test_get_sp500_symbols_cached(self, mock_get: Mock) -> None:
+        """Test that a second call within the TTL is served from the cache."""
+        mock_html = """
+        <html>
+        <body>
+        <table>
+        <tr>
+            <th>No.</th>
+            <th>Symbol</th>
+        </tr>
+        <tr>
+            <td>1</td>
+            <td><a href="/stocks/AAPL/">AAPL</a></td>
+        </tr>
+        </table>
+        </body>
+        </html>
+        """
+
+        mock_get.return_value = _mock_stream_response(mock_html)
+
+        first = get_sp500_symbols()
+        second = get_sp500_symbols()
+
+        assert first == second == ["AAPL"]
+        # Only the first call should have hit the network
+        assert mock_get.call_count == 1
+
+        # force_refresh bypasses the cache and re-scrapes
+        get_sp500_symbols(force_refresh=True)
+        assert mock_get.call_count == 2
+
 
 class TestIsValidSymbol:
     """Test suite for _is_valid_symbol function."""
@@ -221,7 +261,7 @@ class TestFetchPreviousDay5minBars:
                 "volume": 1200000,
             },
         ]
-        mock_client.fetch_bars.return_value = mock_bars
+        mock_client.fetch_bars_batch.return_value = {"AAPL": mock_bars, "MSFT": []}
 
         symbols = ["AAPL", "MSFT"]
         results = fetch_previous_day_5min_bars(symbols)
@@ -232,12 +272,11 @@ class TestFetchPreviousDay5minBars:
         assert results["AAPL"][0]["symbol"] == "AAPL"
         assert "timestamp" in results["AAPL"][0]
 
-        # Verify fetch_bars was called with correct parameters
-        assert mock_client.fetch_bars.called
-        # Check first call (for AAPL)
-        first_call = mock_client.fetch_bars.call_args_list[0]
-        assert first_call[1]["symbol"] == "AAPL"
-        assert first_call[1]["interval"] == "5m"
+        # Verify both symbols went out in a single batch request
+        mock_client.fetch_bars_batch.assert_called_once()
+        call_args = mock_client.fetch_bars_batch.call_args
+        assert call_args[0][0] == ["AAPL", "MSFT"]
+        assert call_args[1]["interval"] == "5m"
 
     @patch("src.utils.YahooFinanceClient")
     def test_fetch_previous_day_5min_bars_multiple_symbols(
@@ -270,16 +309,10 @@ class TestFetchPreviousDay5minBars:
                 "volume": 500000,
             },
         ]
-
-        # Return different data for different symbols
-        def side_effect(symbol, start_time, end_time, interval):
-            if symbol == "AAPL":
-                return mock_bars_aapl
-            elif symbol == "MSFT":
-                return mock_bars_msft
-            return []
-
-        mock_client.fetch_bars.side_effect = side_effect
+        mock_client.fetch_bars_batch.return_value = {
+            "AAPL": mock_bars_aapl,
+            "MSFT": mock_bars_msft,
+        }
 
         symbols = ["AAPL", "MSFT"]
         results = fetch_previous_day_5min_bars(symbols)
@@ -297,7 +330,7 @@ class TestFetchPreviousDay5minBars:
         """Test fetching data for a specific date."""
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.fetch_bars.return_value = []
+        mock_client.fetch_bars_batch.return_value = {"AAPL": []}
 
         custom_date = datetime(2024, 1, 15)
         symbols = ["AAPL"]
@@ -305,8 +338,9 @@ class TestFetchPreviousDay5minBars:
 
         assert "AAPL" in results
         # Verify the date was used correctly
-        call_args = mock_client.fetch_bars.call_args
+        call_args = mock_client.fetch_bars_batch.call_args
         assert call_args[1]["interval"] == "5m"
+        assert call_args[1]["start_time"].date() == custom_date.date()
 
     @patch("src.utils.YahooFinanceClient")
     def test_fetch_previous_day_5min_bars_with_custom_client(
@@ -314,7 +348,7 @@ class TestFetchPreviousDay5minBars:
     ) -> None:
         """Test using a custom client instance."""
         custom_client = MagicMock()
-        custom_client.fetch_bars.return_value = []
+        custom_client.fetch_bars_batch.return_value = {"AAPL": []}
 
         symbols = ["AAPL"]
         results = fetch_previous_day_5min_bars(symbols, client=custom_client)
@@ -322,7 +356,7 @@ class TestFetchPreviousDay5minBars:
         assert "AAPL" in results
         # Verify custom client was used, not a new one
         mock_client_class.assert_not_called()
-        custom_client.fetch_bars.assert_called_once()
+        custom_client.fetch_bars_batch.assert_called_once()
 
     @patch("src.utils.YahooFinanceClient")
     def test_fetch_previous_day_5min_bars_empty_symbols(
@@ -332,15 +366,87 @@ class TestFetchPreviousDay5minBars:
         with pytest.raises(ValueError, match="Symbols list cannot be empty"):
             fetch_previous_day_5min_bars([])
 
+    @patch("src.utils.YahooFinanceClient")
+    def test_fetch_previous_day_5min_bars_skips_invalid_symbols(
+        self, mock_client_class: Mock
+    ) -> None:
+        """Test that invalid symbols are filtered before fetching."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        yesterday = datetime.now().date() - timedelta(days=1)
+        mock_bars = [
+            {
+                "symbol": "AAPL",
+                "timestamp": datetime.combine(yesterday, time(9, 30)),
+                "open": 150.0,
+                "high": 151.0,
+                "low": 149.5,
+                "close": 150.5,
+                "volume": 1000000,
+            },
+        ]
+        mock_client.fetch_bars_batch.return_value = {"AAPL": mock_bars}
+
+        # "INVALID" is too long to be a valid symbol and never hits the client
+        symbols = ["AAPL", "INVALID"]
+        results = fetch_previous_day_5min_bars(symbols)
+
+        assert "AAPL" in results
+        assert "INVALID" in results
+        assert len(results["AAPL"]) == 1
+        assert results["INVALID"] == []
+        assert mock_client.fetch_bars_batch.call_args[0][0] == ["AAPL"]
+
     @patch("src.utils.YahooFinanceClient")
     def test_fetch_previous_day_5min_bars_error_handling(
         self, mock_client_class: Mock
     ) -> None:
-        """Test that errors for individual symbols don't stop processing."""
+        """Test that a failed batch doesn't stop processing."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.fetch_bars_batch.side_effect = ConnectionError("Failed to fetch")
+
+        symbols = ["AAPL", "MSFT"]
+        results = fetch_previous_day_5min_bars(symbols)
+
+        # Both symbols should be in results with empty lists
+        assert results["AAPL"] == []
+        assert results["MSFT"] == []
+
+    @patch("src.utils.PIPELINE_CONFIG", {"batch_size": 2})
+    @patch("src.utils.YahooFinanceClient")
+    def test_fetch_previous_day_5min_bars_chunks_batches(
+        self, mock_client_class: Mock
+    ) -> None:
+        """Test that symbols are fetched in batch_size chunks."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.fetch_bars_batch.side_effect = lambda batch, **kwargs: {
+            symbol: [] for symbol in batch
+        }
+
+        symbols = ["AAPL", "MSFT", "GOOGL"]
+        with patch("src.utils.time_module.sleep") as mock_sleep:
+            results = fetch_previous_day_5min_bars(symbols)
+
+        assert len(results) == 3
+        assert mock_client.fetch_bars_batch.call_count == 2
+        assert mock_client.fetch_bars_batch.call_args_list[0][0][0] == ["AAPL", "MSFT"]
+        assert mock_client.fetch_bars_batch.call_args_list[1][0][0] == ["GOOGL"]
+        # Inter-batch rate-limit delay applied between the two batches
+        assert mock_sleep.called
+
+
+class TestFetchPreviousDay5minBarsParallel:
+    """Test suite for fetch_previous_day_5min_bars_parallel function."""
+
+    @patch("src.utils.YahooFinanceClient")
+    def test_fetch_parallel_success(self, mock_client_class: Mock) -> None:
+        """Test concurrent fetching returns data for all symbols."""
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
 
-        # First symbol succeeds, second fails
         yesterday = datetime.now().date() - timedelta(days=1)
         mock_bars = [
             {
@@ -353,26 +459,109 @@ class TestFetchPreviousDay5minBars:
                 "volume": 1000000,
             },
         ]
+        mock_client.fetch_bars.return_value = mock_bars
+
+        symbols = ["AAPL", "MSFT"]
+        results = fetch_previous_day_5min_bars_parallel(symbols)
+
+        assert isinstance(results, dict)
+        assert set(results.keys()) == {"AAPL", "MSFT"}
+        assert len(results["AAPL"]) == 1
+        assert mock_client.fetch_bars.call_count == 2
+
+    @patch("src.utils.YahooFinanceClient")
+    def test_fetch_parallel_error_handling(self, mock_client_class: Mock) -> None:
+        """Test that errors for individual symbols map to empty lists."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
 
         def side_effect(symbol, start_time, end_time, interval):
-            if symbol == "AAPL":
-                return mock_bars
-            elif symbol == "INVALID":
+            if symbol == "BAD":
                 raise ConnectionError("Failed to fetch")
             return []
 
         mock_client.fetch_bars.side_effect = side_effect
 
-        symbols = ["AAPL", "INVALID"]
-        results = fetch_previous_day_5min_bars(symbols)
+        results = fetch_previous_day_5min_bars_parallel(["AAPL", "BAD"])
 
-        # Both symbols should be in results
-        assert "AAPL" in results
-        assert "INVALID" in results
-        # AAPL should have data
+        assert results["AAPL"] == []
+        assert results["BAD"] == []
+
+    @patch("src.utils.YahooFinanceClient")
+    def test_fetch_parallel_empty_symbols(self, mock_client_class: Mock) -> None:
+        """Test that ValueError is raised for empty symbols list."""
+        with pytest.raises(ValueError, match="Symbols list cannot be empty"):
+            fetch_previous_day_5min_bars_parallel([])
+
+
+class TestBarsToDataframe:
+    """Test suite for bars_to_dataframe and the DataFrame fetch variant."""
+
+    def test_bars_to_dataframe_dtypes(self) -> None:
+        """Test conversion produces typed columns."""
+        yesterday = datetime.now().date() - timedelta(days=1)
+        bars = [
+            {
+                "symbol": "AAPL",
+                "timestamp": datetime.combine(yesterday, time(9, 30)),
+                "open": 150.0,
+                "high": 151.0,
+                "low": 149.5,
+                "close": 150.5,
+                "volume": 1000000,
+            },
+        ]
+
+        df = bars_to_dataframe(bars)
+
+        assert len(df) == 1
+        assert df["open"].dtype == "float64"
+        assert df["volume"].dtype == "int64"
+        assert str(df["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert df.iloc[0]["symbol"] == "AAPL"
+
+    def test_bars_to_dataframe_empty(self) -> None:
+        """Test empty input yields an empty frame with typed columns."""
+        df = bars_to_dataframe([])
+
+        assert df.empty
+        assert list(df.columns) == [
+            "symbol",
+            "timestamp",
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+        ]
+        assert df["close"].dtype == "float64"
+
+    @patch("src.utils.YahooFinanceClient")
+    def test_fetch_previous_day_5min_bars_df(self, mock_client_class: Mock) -> None:
+        """Test the DataFrame fetch variant returns a frame per symbol."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        yesterday = datetime.now().date() - timedelta(days=1)
+        mock_client.fetch_bars_batch.return_value = {
+            "AAPL": [
+                {
+                    "symbol": "AAPL",
+                    "timestamp": datetime.combine(yesterday, time(9, 30)),
+                    "open": 150.0,
+                    "high": 151.0,
+                    "low": 149.5,
+                    "close": 150.5,
+                    "volume": 1000000,
+                },
+            ]
+        }
+
+        results = fetch_previous_day_5min_bars_df(["AAPL"])
+
+        assert isinstance(results["AAPL"], pd.DataFrame)
         assert len(results["AAPL"]) == 1
-        # INVALID should have empty list due to error
-        assert results["INVALID"] == []
+        assert results["AAPL"]["open"].dtype == "float64"
 
 
 class TestGetLastTradingDay: